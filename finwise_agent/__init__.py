@@ -2,6 +2,15 @@
 FinWise Agent package initializer.
 
 This package exposes the agent defined in `agent.py` for ADK discovery.
+`root_agent` is built on first access, so importing the package stays cheap.
 """
 
-from .agent import root_agent  # re-export for convenience
+from typing import Any
+
+from . import agent
+
+
+def __getattr__(name: str) -> Any:
+    if name == "root_agent":
+        return agent.root_agent  # re-export for convenience
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
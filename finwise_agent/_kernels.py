@@ -0,0 +1,47 @@
+"""
+Numba kernels for `agent._reduce`.
+
+Kept out of `agent.py` so importing the tools doesn't import Numba; `agent`
+imports this module on first use and falls back to NumPy when it fails.
+"""
+
+import numpy as np
+from numba import get_num_threads, njit, prange  # noqa: F401 - get_num_threads is used by agent
+
+
+# cache=True keeps the compiled kernel on disk so agent startup doesn't pay the JIT.
+@njit(cache=True)
+def reduce_kernel(cents, is_income, codes, ncat):  # pragma: no cover - compiled
+    total = 0
+    inc = 0
+    exp = 0
+    sums = np.zeros(ncat, dtype=np.int64)
+    for i in range(cents.shape[0]):
+        a = cents[i]
+        total += a
+        # LLVM already if-converts these into selects; hand-written "branchless"
+        # forms benchmarked the same or slower, so keep the readable version.
+        if is_income[i] or a > 0:
+            inc += a
+        if a < 0:
+            exp -= a
+        sums[codes[i]] += a
+    return total, inc, exp, sums
+
+
+@njit(cache=True, parallel=True)
+def reduce_kernel_parallel(cents, is_income, codes, ncat, nchunks):  # pragma: no cover - compiled
+    # Each chunk reduces into its own row, so threads never share accumulators.
+    n = cents.shape[0]
+    step = (n + nchunks - 1) // nchunks
+    totals = np.zeros((nchunks, 3), dtype=np.int64)
+    sums = np.zeros((nchunks, ncat), dtype=np.int64)
+    for c in prange(nchunks):
+        lo = min(n, c * step)
+        hi = min(n, lo + step)
+        total, inc, exp, part = reduce_kernel(cents[lo:hi], is_income[lo:hi], codes[lo:hi], ncat)
+        totals[c, 0] = total
+        totals[c, 1] = inc
+        totals[c, 2] = exp
+        sums[c, :] = part
+    return totals[:, 0].sum(), totals[:, 1].sum(), totals[:, 2].sum(), sums.sum(axis=0)